@@ -319,8 +319,9 @@ class CapabilityMatcher:
         """
 
         # Get all capabilities
-        user1_caps = {(c.type.value, c.name) for c in need_user_profile.capabilities}
-        user2_caps = {(c.type.value, c.name) for c in capability_user_profile.capabilities}
+        # Enum members hash directly - no need to go through .value
+        user1_caps = {(c.type, c.name) for c in need_user_profile.capabilities}
+        user2_caps = {(c.type, c.name) for c in capability_user_profile.capabilities}
 
         # Calculate overlap (lower is more complementary)
         overlap = len(user1_caps & user2_caps)
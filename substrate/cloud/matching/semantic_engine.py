@@ -12,6 +12,7 @@ Key improvements:
 
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import numpy as np
 
 try:
@@ -41,6 +42,12 @@ from ...shared.models.core import (
 from ..transparency.engine import TransparencyEngine
 
 
+@lru_cache(maxsize=None)
+def _load_embedding_model(model_name: str) -> "SentenceTransformer":
+    """Load an embedding model once per process; matchers share the instance"""
+    return SentenceTransformer(model_name)
+
+
 @dataclass
 class SemanticMatchingConfig:
     """Configuration for semantic matching"""
@@ -69,7 +76,7 @@ class SemanticMatcher:
         # Initialize embedding model
         if EMBEDDINGS_AVAILABLE:
             print(f"🧠 Loading embedding model: {self.config.embedding_model}")
-            self.embedding_model = SentenceTransformer(self.config.embedding_model)
+            self.embedding_model = _load_embedding_model(self.config.embedding_model)
             print("✓ Embeddings ready")
         else:
             self.embedding_model = None
@@ -457,8 +464,8 @@ class SemanticMatcher:
         profile2: UserProfile
     ) -> float:
         """Compute capability complementarity between users"""
-        caps1 = {(c.type.value, c.name) for c in profile1.capabilities}
-        caps2 = {(c.type.value, c.name) for c in profile2.capabilities}
+        caps1 = {(c.type, c.name) for c in profile1.capabilities}
+        caps2 = {(c.type, c.name) for c in profile2.capabilities}
 
         overlap = len(caps1 & caps2)
         total = len(caps1 | caps2)
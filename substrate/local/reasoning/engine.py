@@ -11,9 +11,13 @@ Key principles:
 4. Efficient - runs on consumer hardware
 """
 
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, Deque
 from dataclasses import dataclass
+from collections import deque
+from bisect import bisect_right
 import json
+import re
+import numpy as np
 from datetime import datetime
 
 from ...shared.models.core import (
@@ -28,6 +32,72 @@ from ...shared.models.core import (
 )
 
 
+# Keyword heuristics for domain classification (would use LLM in production)
+_DOMAIN_KEYWORDS: Dict[ProblemDomain, List[str]] = {
+    ProblemDomain.ROBOTICS: ["robot", "sensor", "motor", "actuator", "autonomous"],
+    ProblemDomain.SOFTWARE: ["code", "software", "app", "api", "algorithm"],
+    ProblemDomain.HARDWARE: ["circuit", "pcb", "electronic", "hardware"],
+    ProblemDomain.RESEARCH: ["research", "study", "experiment", "hypothesis"],
+    ProblemDomain.BIOLOGY: ["protein", "cell", "genetic", "organism"],
+    ProblemDomain.CLIMATE: ["climate", "carbon", "renewable", "environment"],
+}
+
+_DOMAINS = tuple(_DOMAIN_KEYWORDS)
+_ALL_KEYWORDS = tuple(dict.fromkeys(
+    kw for keywords in _DOMAIN_KEYWORDS.values() for kw in keywords
+))
+
+# (num_domains, num_keywords) membership matrix for batch classification
+_DOMAIN_KEYWORD_MATRIX = np.array(
+    [[kw in keywords for kw in _ALL_KEYWORDS] for keywords in _DOMAIN_KEYWORDS.values()],
+    dtype=np.int32
+)
+
+# Recommendation text by [has_concerns][score bucket]; buckets split at the
+# thresholds below (overall < 0.4, < 0.6, < 0.8, >= 0.8)
+_RECOMMENDATION_THRESHOLDS = (0.4, 0.6, 0.8)
+_RECOMMENDATIONS = (
+    (
+        "Not recommended - low alignment or feasibility",
+        "Consider carefully - moderate match quality",
+        "Recommended - good potential, review concerns",
+        "Highly recommended - strong alignment and feasibility",
+    ),
+    (
+        "Not recommended - low alignment or feasibility",
+        "Consider carefully - moderate match quality",
+        "Recommended - good potential, review concerns",
+        "Recommended - good potential, review concerns",
+    ),
+)
+
+# Keyword heuristics for required capability types. The lookahead makes every
+# position a candidate so overlapping keywords match like plain substrings.
+_CAPABILITY_HEURISTIC_RE = re.compile(
+    r"(?=(?P<skill>build|create|make)"
+    r"|(?P<resource>equipment|lab|tools)"
+    r"|(?P<knowledge>know|understand|expertise)"
+    r"|(?P<funding>funding|money|budget))"
+)
+# Regex group name -> (flag bit, capability type), in the order types are reported
+_CAPABILITY_HEURISTICS = {
+    "skill": (0x1, CapabilityType.SKILL),
+    "resource": (0x2, CapabilityType.RESOURCE),
+    "knowledge": (0x4, CapabilityType.KNOWLEDGE),
+    "funding": (0x8, CapabilityType.FUNDING),
+}
+_ALL_CAPABILITY_HEURISTICS = sum(bit for bit, _ in _CAPABILITY_HEURISTICS.values())
+
+# (user_context key, constraint key) pairs copied by _extract_constraints
+_CONTEXT_CONSTRAINTS = (
+    ("budget", "budget"),
+    ("deadline", "deadline"),
+    ("location_preference", "location"),
+)
+
+_MISSING = object()
+
+
 @dataclass
 class ReasoningConfig:
     """Configuration for local reasoning"""
@@ -35,6 +105,7 @@ class ReasoningConfig:
     max_tokens: int = 2048
     temperature: float = 0.7
     enable_provenance: bool = True
+    history_limit: int = 1000  # Max provenance graphs kept in reasoning_history
 
 
 class LocalReasoningEngine:
@@ -58,8 +129,10 @@ class LocalReasoningEngine:
         # Local knowledge graph (persisted to disk)
         self.knowledge_graph = {}
 
-        # Reasoning history for transparency
-        self.reasoning_history: List[ProvenanceGraph] = []
+        # Reasoning history for transparency (bounded - oldest entries drop off)
+        self.reasoning_history: Deque[ProvenanceGraph] = deque(
+            maxlen=self.config.history_limit
+        )
 
     def analyze_problem(
         self,
@@ -226,6 +299,47 @@ class LocalReasoningEngine:
             "provenance": provenance.to_dict()
         }
 
+    def classify_domains_batch(
+        self,
+        descriptions: List[str]
+    ) -> List[ProblemDomain]:
+        """
+        Classify many problem descriptions into domains at once
+
+        Same keyword heuristic as single-problem analysis, but scores every
+        description against every domain with one matrix product.
+        """
+
+        provenance = ProvenanceGraph(decision_type="batch_domain_classification")
+
+        if descriptions:
+            lowered = [d.lower() for d in descriptions]
+            hits = np.array(
+                [[kw in text for kw in _ALL_KEYWORDS] for text in lowered],
+                dtype=np.int32
+            )
+            scores = hits @ _DOMAIN_KEYWORD_MATRIX.T
+            best = scores.argmax(axis=1)
+            has_match = scores.max(axis=1) > 0
+            domains = [
+                _DOMAINS[idx] if matched else ProblemDomain.OTHER
+                for idx, matched in zip(best.tolist(), has_match.tolist())
+            ]
+        else:
+            domains = []
+
+        provenance.add_step(ProvenanceStep(
+            operation="batch_domain_classification",
+            inputs={"description_count": len(descriptions)},
+            outputs={"domains": [d.value for d in domains]},
+            reasoning="Classified descriptions based on keyword matching",
+            confidence=0.7
+        ))
+
+        self.reasoning_history.append(provenance)
+
+        return domains
+
     def assess_match_quality(
         self,
         need: Need,
@@ -292,19 +406,10 @@ class LocalReasoningEngine:
 
         description_lower = problem_description.lower()
 
-        domain_keywords = {
-            ProblemDomain.ROBOTICS: ["robot", "sensor", "motor", "actuator", "autonomous"],
-            ProblemDomain.SOFTWARE: ["code", "software", "app", "api", "algorithm"],
-            ProblemDomain.HARDWARE: ["circuit", "pcb", "electronic", "hardware"],
-            ProblemDomain.RESEARCH: ["research", "study", "experiment", "hypothesis"],
-            ProblemDomain.BIOLOGY: ["protein", "cell", "genetic", "organism"],
-            ProblemDomain.CLIMATE: ["climate", "carbon", "renewable", "environment"],
-        }
-
         best_domain = ProblemDomain.OTHER
         max_matches = 0
 
-        for domain, keywords in domain_keywords.items():
+        for domain, keywords in _DOMAIN_KEYWORDS.items():
             matches = sum(1 for kw in keywords if kw in description_lower)
             if matches > max_matches:
                 max_matches = matches
@@ -356,20 +461,20 @@ class LocalReasoningEngine:
     ) -> List[CapabilityType]:
         """Identify what types of capabilities are needed"""
 
-        required = []
-
-        # Heuristics for capability types (would use LLM in production)
-        if any(word in problem_description.lower() for word in ["build", "create", "make"]):
-            required.append(CapabilityType.SKILL)
-
-        if any(word in problem_description.lower() for word in ["equipment", "lab", "tools"]):
-            required.append(CapabilityType.RESOURCE)
-
-        if any(word in problem_description.lower() for word in ["know", "understand", "expertise"]):
-            required.append(CapabilityType.KNOWLEDGE)
-
-        if any(word in problem_description.lower() for word in ["funding", "money", "budget"]):
-            required.append(CapabilityType.FUNDING)
+        # Heuristics for capability types (would use LLM in production).
+        # One scan over the description, stopping once every type is found.
+        flags = 0
+        for m in _CAPABILITY_HEURISTIC_RE.finditer(problem_description.lower()):
+            group = m.lastgroup
+            if group is not None:  # Always set: every alternative is a named group
+                flags |= _CAPABILITY_HEURISTICS[group][0]
+            if flags == _ALL_CAPABILITY_HEURISTICS:
+                break
+
+        required = [
+            cap_type for bit, cap_type in _CAPABILITY_HEURISTICS.values()
+            if flags & bit
+        ]
 
         if not required:
             required.append(CapabilityType.SKILL)  # Default
@@ -423,17 +528,11 @@ class LocalReasoningEngine:
 
         constraints = {}
 
-        # Budget constraints
-        if "budget" in user_context:
-            constraints["budget"] = user_context["budget"]
-
-        # Timeline constraints
-        if "deadline" in user_context:
-            constraints["deadline"] = user_context["deadline"]
-
-        # Location constraints
-        if "location_preference" in user_context:
-            constraints["location"] = user_context["location_preference"]
+        # Budget, timeline and location constraints from context
+        for src, dst in _CONTEXT_CONSTRAINTS:
+            value = user_context.get(src, _MISSING)
+            if value is not _MISSING:
+                constraints[dst] = value
 
         # Extract from description (simplified)
         if "remote" in problem_description.lower():
@@ -585,11 +684,10 @@ class LocalReasoningEngine:
             if len(caps) == 1:
                 merged.append(caps[0])
             else:
-                # Merge: take highest proficiency, combine evidence
+                # Merge: take highest proficiency, combine evidence (the
+                # winner's own evidence included)
                 best = max(caps, key=lambda c: c.proficiency)
-                best.evidence = []
-                for cap in caps:
-                    best.evidence.extend(cap.evidence)
+                best.evidence = [item for cap in caps for item in cap.evidence]
                 best.confidence = sum(c.confidence for c in caps) / len(caps)
                 merged.append(best)
 
@@ -615,9 +713,10 @@ class LocalReasoningEngine:
 
         # Remove private capabilities
         if "capabilities" in filtered:
+            private_val = PrivacyLevel.PRIVATE.value
             filtered["capabilities"] = [
                 cap for cap in filtered["capabilities"]
-                if cap.get("privacy_level") != PrivacyLevel.PRIVATE.value
+                if cap.get("privacy_level") != private_val
             ]
 
         # Apply location privacy
@@ -755,14 +854,8 @@ class LocalReasoningEngine:
 
         overall = (alignment + feasibility) / 2
 
-        if overall >= 0.8 and not concerns:
-            recommendation = "Highly recommended - strong alignment and feasibility"
-        elif overall >= 0.6:
-            recommendation = "Recommended - good potential, review concerns"
-        elif overall >= 0.4:
-            recommendation = "Consider carefully - moderate match quality"
-        else:
-            recommendation = "Not recommended - low alignment or feasibility"
+        bucket = bisect_right(_RECOMMENDATION_THRESHOLDS, overall)
+        recommendation = _RECOMMENDATIONS[1 if concerns else 0][bucket]
 
         provenance.add_step(ProvenanceStep(
             operation="recommendation_generation",
@@ -5,11 +5,12 @@ These models are shared across all layers (local, cloud, web) and define
 the fundamental data structures for coordination and transparency.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields as dataclass_fields
 from datetime import datetime
 from enum import Enum
-from typing import List, Dict, Any, Optional, Set
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set, get_origin
 from uuid import uuid4
+import time
 
 
 class PrivacyLevel(Enum):
@@ -20,6 +21,64 @@ class PrivacyLevel(Enum):
     CONFIDENTIAL = "confidential"  # Encrypted even locally
 
 
+def _new_id() -> str:
+    """Random 128-bit identifier as 32 hex chars (uuid4 without dashes)"""
+    return uuid4().hex
+
+
+def timestamp_ns_to_iso(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp as a local ISO-8601 string"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+
+
+# Privacy levels that are never included in shared views
+_UNSHAREABLE_LEVELS = frozenset({PrivacyLevel.PRIVATE, PrivacyLevel.CONFIDENTIAL})
+
+
+def _generated_to_dict(name="to_dict", fields=None, convert=None, empty_if=None, doc=None):
+    """
+    Class decorator that builds a dict-serialization method from the dataclass
+    fields as straight-line source, the way dataclasses builds __init__
+
+    Enum fields serialize as .value and set fields as lists; `convert` maps a
+    field name to a function applied instead. `fields` selects and orders the
+    keys (default: all fields). With `empty_if=(field, values)` the method
+    returns {} when that field's value is in `values`. Decorated classes
+    declare the method under `if TYPE_CHECKING:` for IDEs and type checkers.
+    """
+    def wrap(cls):
+        types = {f.name: f.type for f in dataclass_fields(cls)}
+        namespace = {}
+        items = []
+        for fname in fields or tuple(types):
+            expr = f"self.{fname}"
+            ftype = types[fname]
+            if convert and fname in convert:
+                namespace[f"_convert_{fname}"] = convert[fname]
+                expr = f"_convert_{fname}({expr})"
+            elif isinstance(ftype, type) and issubclass(ftype, Enum):
+                expr = f"{expr}.value"
+            elif get_origin(ftype) is set:
+                expr = f"list({expr})"
+            items.append(f"{fname!r}: {expr}")
+
+        lines = [f"def {name}(self):"]
+        if empty_if:
+            namespace["_empty_values"] = frozenset(empty_if[1])
+            lines.append(f"    if self.{empty_if[0]} in _empty_values:")
+            lines.append("        return {}")
+        lines.append("    return {" + ", ".join(items) + "}")
+        exec("\n".join(lines), namespace)
+
+        method = namespace[name]
+        method.__module__ = cls.__module__
+        method.__qualname__ = f"{cls.__qualname__}.{name}"
+        method.__doc__ = doc
+        setattr(cls, name, method)
+        return cls
+    return wrap
+
+
 class CapabilityType(Enum):
     """Types of capabilities"""
     SKILL = "skill"                # Technical expertise
@@ -44,10 +103,16 @@ class ProblemDomain(Enum):
     OTHER = "other"
 
 
-@dataclass
+@_generated_to_dict(
+    "to_shareable_dict",
+    fields=("type", "name", "description", "proficiency", "tags"),
+    empty_if=("privacy_level", _UNSHAREABLE_LEVELS),  # Don't share private data
+    doc="Convert to dictionary for sharing (respecting privacy)"
+)
+@dataclass(slots=True)
 class Capability:
     """A capability that someone possesses"""
-    capability_id: str = field(default_factory=lambda: str(uuid4()))
+    capability_id: str = field(default_factory=_new_id)
     type: CapabilityType = CapabilityType.SKILL
     name: str = ""
     description: str = ""
@@ -58,24 +123,15 @@ class Capability:
     tags: Set[str] = field(default_factory=set)
     metadata: Dict[str, Any] = field(default_factory=dict)
 
-    def to_shareable_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for sharing (respecting privacy)"""
-        if self.privacy_level in [PrivacyLevel.PRIVATE, PrivacyLevel.CONFIDENTIAL]:
-            return {}  # Don't share private data
+    if TYPE_CHECKING:  # Generated by @_generated_to_dict
+        def to_shareable_dict(self) -> Dict[str, Any]: ...
 
-        return {
-            "type": self.type.value,
-            "name": self.name,
-            "description": self.description,
-            "proficiency": self.proficiency,
-            "tags": list(self.tags)
-        }
 
-
-@dataclass
+@_generated_to_dict()
+@dataclass(slots=True)
 class Need:
     """A need that someone has"""
-    need_id: str = field(default_factory=lambda: str(uuid4()))
+    need_id: str = field(default_factory=_new_id)
     type: CapabilityType = CapabilityType.SKILL
     name: str = ""
     description: str = ""
@@ -86,25 +142,14 @@ class Need:
     constraints: Dict[str, Any] = field(default_factory=dict)
     tags: Set[str] = field(default_factory=set)
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "need_id": self.need_id,
-            "type": self.type.value,
-            "name": self.name,
-            "description": self.description,
-            "urgency": self.urgency,
-            "importance": self.importance,
-            "domain": self.domain.value,
-            "context": self.context,
-            "constraints": self.constraints,
-            "tags": list(self.tags)
-        }
+    if TYPE_CHECKING:  # Generated by @_generated_to_dict
+        def to_dict(self) -> Dict[str, Any]: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     """Anonymous user profile for matching"""
-    user_id: str = field(default_factory=lambda: str(uuid4()))
+    user_id: str = field(default_factory=_new_id)
     capabilities: List[Capability] = field(default_factory=list)
     needs: List[Need] = field(default_factory=list)
     domains: Set[ProblemDomain] = field(default_factory=set)
@@ -128,11 +173,12 @@ class UserProfile:
         }
 
 
-@dataclass
+@_generated_to_dict(convert={"timestamp": timestamp_ns_to_iso})
+@dataclass(slots=True)
 class ProvenanceStep:
     """A single step in the reasoning process"""
-    step_id: str = field(default_factory=lambda: str(uuid4()))
-    timestamp: datetime = field(default_factory=datetime.now)
+    step_id: str = field(default_factory=_new_id)
+    timestamp: int = field(default_factory=time.time_ns)  # Epoch nanoseconds
     operation: str = ""  # What operation was performed
     inputs: Dict[str, Any] = field(default_factory=dict)
     outputs: Dict[str, Any] = field(default_factory=dict)
@@ -140,26 +186,17 @@ class ProvenanceStep:
     confidence: float = 1.0
     alternatives_considered: List[Dict[str, Any]] = field(default_factory=list)
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "step_id": self.step_id,
-            "timestamp": self.timestamp.isoformat(),
-            "operation": self.operation,
-            "inputs": self.inputs,
-            "outputs": self.outputs,
-            "reasoning": self.reasoning,
-            "confidence": self.confidence,
-            "alternatives_considered": self.alternatives_considered
-        }
+    if TYPE_CHECKING:  # Generated by @_generated_to_dict
+        def to_dict(self) -> Dict[str, Any]: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ProvenanceGraph:
     """Complete provenance for a decision"""
-    graph_id: str = field(default_factory=lambda: str(uuid4()))
+    graph_id: str = field(default_factory=_new_id)
     decision_type: str = ""  # e.g., "capability_match", "team_optimization"
     steps: List[ProvenanceStep] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: int = field(default_factory=time.time_ns)  # Epoch nanoseconds
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def add_step(self, step: ProvenanceStep):
@@ -171,28 +208,29 @@ class ProvenanceGraph:
             "graph_id": self.graph_id,
             "decision_type": self.decision_type,
             "steps": [step.to_dict() for step in self.steps],
-            "created_at": self.created_at.isoformat(),
+            "created_at": timestamp_ns_to_iso(self.created_at),
             "metadata": self.metadata
         }
 
     def get_summary(self) -> str:
         """Human-readable summary of the reasoning"""
-        summary = f"Decision: {self.decision_type}\n"
-        summary += f"Steps taken: {len(self.steps)}\n\n"
+        parts = [f"Decision: {self.decision_type}", f"Steps taken: {len(self.steps)}", ""]
         for i, step in enumerate(self.steps, 1):
-            summary += f"{i}. {step.operation}\n"
-            summary += f"   Reasoning: {step.reasoning}\n"
-            summary += f"   Confidence: {step.confidence:.2f}\n"
+            parts.append(f"{i}. {step.operation}")
+            parts.append(f"   Reasoning: {step.reasoning}")
+            parts.append(f"   Confidence: {step.confidence:.2f}")
             if step.alternatives_considered:
-                summary += f"   Alternatives considered: {len(step.alternatives_considered)}\n"
-            summary += "\n"
-        return summary
+                parts.append(f"   Alternatives considered: {len(step.alternatives_considered)}")
+            parts.append("")
+        # Trailing "" gives the final newline the += version ended with
+        parts.append("")
+        return "\n".join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class Match:
     """A match between a need and a capability"""
-    match_id: str = field(default_factory=lambda: str(uuid4()))
+    match_id: str = field(default_factory=_new_id)
     need: Need = None
     need_user_id: str = ""
     capability: Capability = None
@@ -215,7 +253,7 @@ class Match:
     # Verification
     verification_methods: List[str] = field(default_factory=list)
 
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: int = field(default_factory=time.time_ns)  # Epoch nanoseconds
 
     def get_explanation(self) -> Dict[str, Any]:
         """Generate complete explanation for this match"""
@@ -246,14 +284,14 @@ class Match:
             "match_score": self.match_score,
             "confidence": self.confidence,
             "explanation": self.get_explanation(),
-            "created_at": self.created_at.isoformat()
+            "created_at": timestamp_ns_to_iso(self.created_at)
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Team:
     """A proposed team composition"""
-    team_id: str = field(default_factory=lambda: str(uuid4()))
+    team_id: str = field(default_factory=_new_id)
     problem_description: str = ""
     members: List[str] = field(default_factory=list)  # User IDs
     roles: Dict[str, str] = field(default_factory=dict)  # user_id -> role
@@ -306,10 +344,10 @@ class Team:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CollaborationOutcome:
     """Track actual outcomes for learning"""
-    outcome_id: str = field(default_factory=lambda: str(uuid4()))
+    outcome_id: str = field(default_factory=_new_id)
     match_id: Optional[str] = None
     team_id: Optional[str] = None
 
@@ -10,12 +10,32 @@ Makes Substrate remember everything:
 This enables the system to actually get better over time.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 from datetime import datetime
+import queue
 import sqlite3
+import sys
+import threading
+import weakref
+from concurrent.futures import Future
 import json
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        # Decode to str so columns stay TEXT and readable by the json fallback
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    _dumps = json.dumps
+    _loads = json.loads
+
 from ...shared.models.core import (
     UserProfile,
     Capability,
@@ -25,10 +45,300 @@ from ...shared.models.core import (
     CollaborationOutcome,
     CapabilityType,
     ProblemDomain,
-    PrivacyLevel
+    PrivacyLevel,
+    timestamp_ns_to_iso
 )
 
 
+# Enum member -> stored value, looked up per row in the save paths
+_CAP_TYPE_V = {t: t.value for t in CapabilityType}
+_DOMAIN_V = {d: d.value for d in ProblemDomain}
+_PRIVACY_V = {p: p.value for p in PrivacyLevel}
+
+
+# Step fields that identify a repeated event (everything but id and timestamp)
+_PROVENANCE_STEP_CONTENT = (
+    "operation", "inputs", "outputs", "reasoning", "confidence", "alternatives_considered"
+)
+
+
+def reduce_provenance(provenance: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Shrink a provenance dict for storage without losing its causal order
+
+    - Step fields still at their defaults (empty inputs/outputs/reasoning/
+      alternatives, confidence 1.0) are dropped
+    - Consecutive repeats of the same step collapse into one step with a
+      "repeat" count; the first step_id and timestamp are kept
+    """
+
+    steps = []
+    last_key = None
+    for step in provenance.get("steps", ()):
+        reduced = {
+            k: v for k, v in step.items()
+            if not (v in ("", {}, []) or (k == "confidence" and v == 1.0))
+        }
+        key = _dumps([reduced.get(k) for k in _PROVENANCE_STEP_CONTENT])
+        if key == last_key:
+            steps[-1]["repeat"] = steps[-1].get("repeat", 1) + 1
+            continue
+        last_key = key
+        steps.append(reduced)
+
+    reduced_graph = {k: v for k, v in provenance.items() if v not in ("", {}, [])}
+    reduced_graph["steps"] = steps
+    return reduced_graph
+
+
+def _pack_provenance(provenance: Dict[str, Any]) -> bytes:
+    """Reduce and compress a provenance dict into a BLOB"""
+    return zlib.compress(_dumps(reduce_provenance(provenance)).encode())
+
+
+def _unpack_provenance(value: Any) -> Optional[Dict[str, Any]]:
+    """
+    Decode a stored provenance column (compressed BLOB or legacy JSON text)
+
+    Fields dropped by reduce_provenance are filled back in, so the result has
+    the ProvenanceGraph.to_dict() shape. Collapsed repeats are not expanded
+    (their step_ids and timestamps were not kept): such a step carries an
+    extra "repeat" key with the number of consecutive occurrences.
+    """
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        value = zlib.decompress(value)
+    provenance = _loads(value)
+    provenance.setdefault("decision_type", "")
+    provenance.setdefault("metadata", {})
+    provenance["steps"] = [
+        {
+            "operation": "", "inputs": {}, "outputs": {}, "reasoning": "",
+            "confidence": 1.0, "alternatives_considered": [],
+            **step
+        }
+        for step in provenance.get("steps", ())
+    ]
+    return provenance
+
+
+# Most queued writes the writer thread commits in one transaction
+_WRITE_BATCH_MAX = 1000
+
+
+# Statements used on every request. Kept as constants so the text is identical
+# across calls and sqlite3's statement cache reuses the prepared statement.
+
+# An update bumps the row's version, which load_user_profile uses to tell
+# whether its cached rows are still current
+_SQL_UPSERT_USER = """
+    INSERT INTO users
+    (user_id, location_region, timezone, domains, preferences, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(user_id) DO UPDATE SET
+        location_region = excluded.location_region,
+        timezone = excluded.timezone,
+        domains = excluded.domains,
+        preferences = excluded.preferences,
+        created_at = excluded.created_at,
+        updated_at = excluded.updated_at,
+        version = version + 1
+"""
+
+_SQL_UPSERT_CAPABILITY = """
+    INSERT OR REPLACE INTO capabilities
+    (capability_id, user_id, type, name, description, proficiency,
+     confidence, evidence, privacy_level, tags, metadata, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_USER_VERSION = "SELECT version FROM users WHERE user_id = ?"
+
+_SQL_SELECT_USER_WITH_CAPABILITIES = """
+    SELECT u.user_id, u.location_region, u.timezone, u.domains, u.preferences,
+           u.created_at, u.updated_at, u.version,
+           c.capability_id, c.type AS cap_type, c.name AS cap_name,
+           c.description AS cap_description, c.proficiency AS cap_proficiency,
+           c.confidence AS cap_confidence, c.evidence AS cap_evidence,
+           c.privacy_level AS cap_privacy_level, c.tags AS cap_tags,
+           c.metadata AS cap_metadata
+    FROM users u
+    LEFT JOIN capabilities c ON c.user_id = u.user_id
+    WHERE u.user_id = ?
+"""
+
+_SQL_SEARCH_CAPABILITIES = """
+    SELECT capability_id FROM capabilities_fts
+    WHERE capabilities_fts MATCH ?
+    ORDER BY rank
+    LIMIT ?
+"""
+
+_SQL_UPSERT_NEED = """
+    INSERT OR REPLACE INTO needs
+    (need_id, user_id, type, name, description, urgency, importance,
+     domain, context, constraints, tags, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPSERT_MATCH = """
+    INSERT OR REPLACE INTO matches
+    (match_id, need_id, need_user_id, capability_id, capability_user_id,
+     match_score, complementarity_score, feasibility_score, confidence,
+     provenance, evidence, uncertainty_factors, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_UPDATE_MATCH_STATUS = "UPDATE matches SET status = ? WHERE match_id = ?"
+
+_SQL_UPSERT_OUTCOME = """
+    INSERT OR REPLACE INTO outcomes
+    (outcome_id, match_id, success, completion_date, actual_timeline,
+     actual_cost, problem_solved, knowledge_created, artifacts_produced,
+     what_worked, what_didnt, lessons_learned, participant_ratings, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_MATCH_FEATURES = """
+    SELECT match_score, complementarity_score, feasibility_score, confidence
+    FROM matches WHERE match_id = ?
+"""
+
+_SQL_INSERT_LEARNING_SIGNAL = """
+    INSERT INTO learning_signals
+    (match_id, signal_type, signal_value, features, created_at)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_MATCH_HISTORY = """
+    SELECT match_id, need_id, need_user_id, capability_id, capability_user_id,
+           match_score, complementarity_score, feasibility_score, confidence,
+           provenance, evidence, uncertainty_factors, created_at, status
+    FROM matches
+    ORDER BY created_at DESC
+    LIMIT ?
+"""
+
+_SQL_LEARNING_SIGNALS = """
+    SELECT signal_id, match_id, signal_type, signal_value, features, created_at
+    FROM learning_signals
+    ORDER BY created_at DESC
+"""
+
+_SQL_LEARNING_SIGNALS_BY_TYPE = """
+    SELECT signal_id, match_id, signal_type, signal_value, features, created_at
+    FROM learning_signals
+    WHERE signal_type = ?
+    ORDER BY created_at DESC
+"""
+
+_SQL_OUTCOME_SUCCESS_TOTALS = """
+    SELECT COUNT(*) as total,
+           SUM(CASE WHEN signal_value > 0.5 THEN 1 ELSE 0 END) as successes
+    FROM learning_signals
+    WHERE signal_type = 'outcome'
+"""
+
+_SQL_OUTCOME_SUCCESS_BY_SCORE = """
+    SELECT CAST(json_extract(features, '$.match_score') * 10 AS INTEGER) as bucket,
+           COUNT(*) as total,
+           SUM(CASE WHEN signal_value > 0.5 THEN 1 ELSE 0 END) as successes
+    FROM learning_signals
+    WHERE signal_type = 'outcome'
+    GROUP BY bucket
+    ORDER BY bucket
+"""
+
+_SQL_REQUESTER_STATS = """
+    SELECT COUNT(*) as count, AVG(match_score) as avg_score
+    FROM matches WHERE need_user_id = ?
+"""
+
+_SQL_PROVIDER_STATS = """
+    SELECT COUNT(*) as count, AVG(match_score) as avg_score
+    FROM matches WHERE capability_user_id = ?
+"""
+
+
+def _open_connection(db_path: Path) -> sqlite3.Connection:
+    """Open a read/write connection with the standard pragmas"""
+
+    # Autocommit mode: single statements commit on their own, multi-statement
+    # writes go through SubstrateDatabase._transaction()
+    conn = sqlite3.connect(
+        str(db_path),
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=256
+    )
+    conn.row_factory = sqlite3.Row
+
+    # WAL lets readers proceed during writes and avoids an fsync per commit
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")  # 64MB
+    conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+    # INSERT OR REPLACE only fires delete triggers (FTS sync) with this on
+    conn.execute("PRAGMA recursive_triggers=ON")
+    return conn
+
+
+def _commit_writes(conn: sqlite3.Connection, writes: List[tuple]):
+    """Apply queued (sql, rows, future) writes in one transaction"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for sql, rows, _ in writes:
+            conn.executemany(sql, rows)
+        conn.execute("COMMIT")
+    except BaseException:
+        # A failed COMMIT may leave the transaction open (or SQLite may
+        # already have rolled it back); either way end it before re-raising
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+
+def _writer_loop(db_path: Path, write_q: queue.Queue):
+    """
+    Writer thread: commit everything pending as one transaction
+
+    If a group fails, its writes are replayed one per transaction so only
+    the failing caller sees the error. A None item stops the thread.
+    """
+
+    conn = _open_connection(db_path)
+    while True:
+        batch = [write_q.get()]
+        while len(batch) < _WRITE_BATCH_MAX:
+            try:
+                batch.append(write_q.get_nowait())
+            except queue.Empty:
+                break
+
+        writes = [item for item in batch if item is not None]
+        if writes:
+            try:
+                _commit_writes(conn, writes)
+                for _, _, done in writes:
+                    done.set_result(None)
+            except Exception:
+                for write in writes:
+                    try:
+                        _commit_writes(conn, [write])
+                        write[2].set_result(None)
+                    except Exception as e:
+                        write[2].set_exception(e)
+
+        for _ in batch:
+            write_q.task_done()
+
+        if None in batch:
+            conn.close()
+            return
+
+
 class SubstrateDatabase:
     """
     SQLite persistence for Substrate
@@ -40,15 +350,111 @@ class SubstrateDatabase:
     - Learning signals for improvement
     """
 
-    def __init__(self, db_path: str = "./substrate_data/substrate.db"):
+    def __init__(
+        self,
+        db_path: str = "./substrate_data/substrate.db",
+        profile_cache_size: int = 1024
+    ):
+        # ":memory:" and "" give each connection its own private database
+        self._in_memory = db_path in (":memory:", "")
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.conn.row_factory = sqlite3.Row
+        self.conn = _open_connection(self.db_path)
 
         self._create_tables()
 
+        # Fetched profile rows keyed by user_id -> (version, rows), checked
+        # against the users.version column; oldest entries are evicted first.
+        # Shared by request threads, so access goes through the lock.
+        self._profile_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._profile_cache_size = profile_cache_size
+        self._profile_cache_lock = threading.Lock()
+
+        # Aggregate queries run on a separate read-only connection so their
+        # scans read a WAL snapshot instead of sharing the write connection
+        self._analytics_conn: Optional[sqlite3.Connection] = None
+
+        # Match writes are queued as (sql, rows, future) to a single writer
+        # thread on its own connection. Callers wait for their own commit, so
+        # concurrent writers share one transaction instead of each taking the
+        # write lock. The thread holds no reference to self; if the database
+        # is garbage-collected without close(), the finalizer stops it.
+        # An in-memory database only exists on self.conn, so it has no writer
+        # thread and writes are committed inline instead.
+        self._write_q: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._write_lock = threading.Lock()
+        self._writer_stopped = False
+        self._writer: Optional[threading.Thread] = None
+        if not self._in_memory:
+            self._writer = threading.Thread(
+                target=_writer_loop,
+                args=(self.db_path, self._write_q),
+                name="substrate-db-writer",
+                daemon=True
+            )
+            self._writer.start()
+            self._stop_writer = weakref.finalize(self, self._write_q.put, None)
+
+    def flush(self):
+        """
+        Block until every write queued so far (by any thread) is committed
+
+        save_match(es) and update_match_status already wait for their own
+        write; this is only needed to observe other threads' writes.
+        """
+
+        if self._writer is not None and self._writer.is_alive():
+            self._write_q.join()
+
+    def _write(self, sql: str, rows: List[tuple]):
+        """Queue a write for the writer thread and wait until it is committed"""
+
+        done: Future = Future()
+        with self._write_lock:
+            if self._writer_stopped:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            if self._writer is None:
+                _commit_writes(self.conn, [(sql, rows, done)])
+                return
+            self._write_q.put((sql, rows, done))
+
+        # Raises this write's own error, if any
+        done.result()
+
+    def _analytics(self) -> sqlite3.Connection:
+        """Read-only connection for analytical queries (opened on first use)"""
+
+        # A second connection can't see an in-memory database
+        if self._in_memory:
+            return self.conn
+
+        if self._analytics_conn is None:
+            conn = sqlite3.connect(
+                f"{self.db_path.resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+                isolation_level=None
+            )
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA query_only=ON")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+            self._analytics_conn = conn
+        return self._analytics_conn
+
+    @contextmanager
+    def _transaction(self, mode: str = "DEFERRED"):
+        """Run the enclosed statements as a single transaction"""
+        self.conn.execute(f"BEGIN {mode}")
+        try:
+            yield
+            self.conn.execute("COMMIT")
+        except BaseException:
+            if self.conn.in_transaction:
+                self.conn.execute("ROLLBACK")
+            raise
+
     def _create_tables(self):
         """Create database schema"""
 
@@ -63,10 +469,16 @@ class SubstrateDatabase:
                 domains TEXT,  -- JSON array
                 preferences TEXT,  -- JSON object
                 created_at TEXT,
-                updated_at TEXT
+                updated_at TEXT,
+                version INTEGER NOT NULL DEFAULT 0  -- bumped on every update
             )
         """)
 
+        # Databases created before the version column need it added
+        user_columns = {row['name'] for row in cursor.execute("PRAGMA table_info(users)")}
+        if "version" not in user_columns:
+            cursor.execute("ALTER TABLE users ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+
         # Capabilities table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS capabilities (
@@ -96,6 +508,44 @@ class SubstrateDatabase:
             ON capabilities(type)
         """)
 
+        # Full-text index over capability tags/name/description, kept in sync
+        # by triggers (external content, so the text is not stored twice)
+        fts_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'capabilities_fts'"
+        ).fetchone()
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS capabilities_fts USING fts5(
+                capability_id UNINDEXED, tags, name, description,
+                content='capabilities', content_rowid='rowid'
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS capabilities_fts_insert
+            AFTER INSERT ON capabilities BEGIN
+                INSERT INTO capabilities_fts(rowid, capability_id, tags, name, description)
+                VALUES (new.rowid, new.capability_id, new.tags, new.name, new.description);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS capabilities_fts_delete
+            AFTER DELETE ON capabilities BEGIN
+                INSERT INTO capabilities_fts(capabilities_fts, rowid, capability_id, tags, name, description)
+                VALUES ('delete', old.rowid, old.capability_id, old.tags, old.name, old.description);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS capabilities_fts_update
+            AFTER UPDATE ON capabilities BEGIN
+                INSERT INTO capabilities_fts(capabilities_fts, rowid, capability_id, tags, name, description)
+                VALUES ('delete', old.rowid, old.capability_id, old.tags, old.name, old.description);
+                INSERT INTO capabilities_fts(rowid, capability_id, tags, name, description)
+                VALUES (new.rowid, new.capability_id, new.tags, new.name, new.description);
+            END
+        """)
+        if not fts_exists:
+            # Index rows written before the FTS table existed
+            cursor.execute("INSERT INTO capabilities_fts(capabilities_fts) VALUES ('rebuild')")
+
         # Needs table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS needs (
@@ -128,7 +578,7 @@ class SubstrateDatabase:
                 complementarity_score REAL,
                 feasibility_score REAL,
                 confidence REAL,
-                provenance TEXT,  -- JSON object
+                provenance BLOB,  -- zlib-compressed JSON object (see reduce_provenance)
                 evidence TEXT,  -- JSON array
                 uncertainty_factors TEXT,  -- JSON array
                 created_at TEXT,
@@ -148,6 +598,22 @@ class SubstrateDatabase:
             ON matches(need_user_id, capability_user_id)
         """)
 
+        # Covering indexes for per-user stats (COUNT/AVG answered from the index)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_matches_need_user
+            ON matches(need_user_id, match_score)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_matches_cap_user
+            ON matches(capability_user_id, match_score)
+        """)
+
+        # Recency ordering for match history
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_matches_created
+            ON matches(created_at DESC)
+        """)
+
         # Collaboration outcomes table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS outcomes (
@@ -181,82 +647,94 @@ class SubstrateDatabase:
                 FOREIGN KEY (match_id) REFERENCES matches(match_id)
             )
         """)
-
-        self.conn.commit()
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_signals_type
+            ON learning_signals(signal_type)
+        """)
 
     def save_user_profile(self, profile: UserProfile):
         """Save or update a user profile"""
 
-        cursor = self.conn.cursor()
-
-        # Save user
-        cursor.execute("""
-            INSERT OR REPLACE INTO users
-            (user_id, location_region, timezone, domains, preferences, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            profile.user_id,
-            profile.location_region,
-            profile.timezone,
-            json.dumps([d.value for d in profile.domains]),
-            json.dumps(profile.preferences),
-            profile.created_at.isoformat(),
-            profile.updated_at.isoformat()
-        ))
+        with self._profile_cache_lock:
+            self._profile_cache.pop(profile.user_id, None)
 
-        # Save capabilities
-        for cap in profile.capabilities:
-            cursor.execute("""
-                INSERT OR REPLACE INTO capabilities
-                (capability_id, user_id, type, name, description, proficiency,
-                 confidence, evidence, privacy_level, tags, metadata, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                cap.capability_id,
+        with self._transaction():
+            # Save user
+            self.conn.execute(_SQL_UPSERT_USER, (
                 profile.user_id,
-                cap.type.value,
-                cap.name,
-                cap.description,
-                cap.proficiency,
-                cap.confidence,
-                json.dumps(cap.evidence),
-                cap.privacy_level.value,
-                json.dumps(list(cap.tags)),
-                json.dumps(cap.metadata),
-                datetime.now().isoformat()
+                profile.location_region,
+                profile.timezone,
+                _dumps([_DOMAIN_V[d] for d in profile.domains]),
+                _dumps(profile.preferences),
+                profile.created_at.isoformat(),
+                profile.updated_at.isoformat()
             ))
 
-        self.conn.commit()
+            # Save capabilities (one statement, rebound per row, same transaction)
+            now = datetime.now().isoformat()
+            self.conn.executemany(_SQL_UPSERT_CAPABILITY, [
+                (
+                    cap.capability_id,
+                    profile.user_id,
+                    _CAP_TYPE_V[cap.type],
+                    cap.name,
+                    cap.description,
+                    cap.proficiency,
+                    cap.confidence,
+                    _dumps(cap.evidence),
+                    _PRIVACY_V[cap.privacy_level],
+                    _dumps(list(cap.tags)),
+                    _dumps(cap.metadata),
+                    now
+                )
+                for cap in profile.capabilities
+            ])
 
     def load_user_profile(self, user_id: str) -> Optional[UserProfile]:
         """Load a user profile"""
 
-        cursor = self.conn.cursor()
+        # Cheap version probe first; reuse the cached rows if they are current
+        version = self.conn.execute(_SQL_SELECT_USER_VERSION, (user_id,)).fetchone()
+        if version is None:
+            with self._profile_cache_lock:
+                self._profile_cache.pop(user_id, None)
+            return None
 
-        # Load user
-        cursor.execute("SELECT * FROM users WHERE user_id = ?", (user_id,))
-        user_row = cursor.fetchone()
+        with self._profile_cache_lock:
+            cached = self._profile_cache.get(user_id)
+        if cached is not None and cached[0] == version['version']:
+            rows = cached[1]
+        else:
+            # Load user and capabilities in one query (one row per capability,
+            # or a single row with NULL capability columns if there are none)
+            rows = self.conn.execute(_SQL_SELECT_USER_WITH_CAPABILITIES, (user_id,)).fetchall()
 
-        if not user_row:
-            return None
+            if not rows:
+                return None
 
-        # Load capabilities
-        cursor.execute("SELECT * FROM capabilities WHERE user_id = ?", (user_id,))
-        cap_rows = cursor.fetchall()
+            with self._profile_cache_lock:
+                self._profile_cache[user_id] = (rows[0]['version'], rows)
+                if len(self._profile_cache) > self._profile_cache_size:
+                    self._profile_cache.popitem(last=False)
+
+        # Rows are immutable; every caller gets freshly built model objects
+        user_row = rows[0]
 
         capabilities = []
-        for row in cap_rows:
+        for row in rows:
+            if row['capability_id'] is None:
+                continue
             cap = Capability(
                 capability_id=row['capability_id'],
-                type=CapabilityType(row['type']),
-                name=row['name'],
-                description=row['description'],
-                proficiency=row['proficiency'],
-                confidence=row['confidence'],
-                evidence=json.loads(row['evidence']),
-                privacy_level=PrivacyLevel(row['privacy_level']),
-                tags=set(json.loads(row['tags'])),
-                metadata=json.loads(row['metadata'])
+                type=CapabilityType(row['cap_type']),
+                name=row['cap_name'],
+                description=row['cap_description'],
+                proficiency=row['cap_proficiency'],
+                confidence=row['cap_confidence'],
+                evidence=_loads(row['cap_evidence']),
+                privacy_level=PrivacyLevel(row['cap_privacy_level']),
+                tags=set(map(sys.intern, _loads(row['cap_tags']))),
+                metadata=_loads(row['cap_metadata'])
             )
             capabilities.append(cap)
 
@@ -264,93 +742,89 @@ class SubstrateDatabase:
         profile = UserProfile(
             user_id=user_row['user_id'],
             capabilities=capabilities,
-            domains={ProblemDomain(d) for d in json.loads(user_row['domains'])},
+            domains={ProblemDomain(d) for d in _loads(user_row['domains'])},
             location_region=user_row['location_region'],
             timezone=user_row['timezone'],
-            preferences=json.loads(user_row['preferences']),
+            preferences=_loads(user_row['preferences']),
             created_at=datetime.fromisoformat(user_row['created_at']),
             updated_at=datetime.fromisoformat(user_row['updated_at'])
         )
 
         return profile
 
+    def search_capabilities(self, query: str, limit: int = 100) -> List[str]:
+        """
+        Find capability ids by tag/name/description using the FTS5 index
+
+        query uses FTS5 syntax, e.g. 'tags:python' or 'machine AND learning'.
+        Results are ordered by relevance.
+        """
+
+        return [
+            row['capability_id']
+            for row in self.conn.execute(_SQL_SEARCH_CAPABILITIES, (query, limit))
+        ]
+
     def save_need(self, need: Need, user_id: str):
         """Save a need"""
 
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO needs
-            (need_id, user_id, type, name, description, urgency, importance,
-             domain, context, constraints, tags, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self.conn.execute(_SQL_UPSERT_NEED, (
             need.need_id,
             user_id,
-            need.type.value,
+            _CAP_TYPE_V[need.type],
             need.name,
             need.description,
             need.urgency,
             need.importance,
-            need.domain.value,
+            _DOMAIN_V[need.domain],
             need.context,
-            json.dumps(need.constraints),
-            json.dumps(list(need.tags)),
+            _dumps(need.constraints),
+            _dumps(list(need.tags)),
             datetime.now().isoformat()
         ))
 
-        self.conn.commit()
-
     def save_match(self, match: Match):
         """Save a match"""
+        self.save_matches([match])
+
+    def save_matches(self, matches: List[Match]):
+        """
+        Save many matches
+
+        Rows go through the writer thread, which commits them together with
+        any other threads' pending writes; returns once they are committed.
+        """
+
+        rows = [
+            (
+                match.match_id,
+                match.need.need_id if match.need else None,
+                match.need_user_id,
+                match.capability.capability_id if match.capability else None,
+                match.capability_user_id,
+                match.match_score,
+                match.complementarity_score,
+                match.feasibility_score,
+                match.confidence,
+                _pack_provenance(match.provenance.to_dict()),
+                _dumps(match.evidence),
+                _dumps(match.uncertainty_factors),
+                timestamp_ns_to_iso(match.created_at)
+            )
+            for match in matches
+        ]
 
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO matches
-            (match_id, need_id, need_user_id, capability_id, capability_user_id,
-             match_score, complementarity_score, feasibility_score, confidence,
-             provenance, evidence, uncertainty_factors, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            match.match_id,
-            match.need.need_id if match.need else None,
-            match.need_user_id,
-            match.capability.capability_id if match.capability else None,
-            match.capability_user_id,
-            match.match_score,
-            match.complementarity_score,
-            match.feasibility_score,
-            match.confidence,
-            json.dumps(match.provenance.to_dict()),
-            json.dumps(match.evidence),
-            json.dumps(match.uncertainty_factors),
-            match.created_at.isoformat()
-        ))
-
-        self.conn.commit()
+        self._write(_SQL_UPSERT_MATCH, rows)
 
     def update_match_status(self, match_id: str, status: str):
         """Update match status (proposed → accepted → completed)"""
 
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            UPDATE matches SET status = ? WHERE match_id = ?
-        """, (status, match_id))
-        self.conn.commit()
+        self._write(_SQL_UPDATE_MATCH_STATUS, [(status, match_id)])
 
     def save_outcome(self, outcome: CollaborationOutcome):
         """Save collaboration outcome"""
 
-        cursor = self.conn.cursor()
-
-        cursor.execute("""
-            INSERT OR REPLACE INTO outcomes
-            (outcome_id, match_id, success, completion_date, actual_timeline,
-             actual_cost, problem_solved, knowledge_created, artifacts_produced,
-             what_worked, what_didnt, lessons_learned, participant_ratings, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        self.conn.execute(_SQL_UPSERT_OUTCOME, (
             outcome.outcome_id,
             outcome.match_id,
             outcome.success,
@@ -358,17 +832,15 @@ class SubstrateDatabase:
             outcome.actual_timeline,
             outcome.actual_cost,
             outcome.problem_solved,
-            json.dumps(outcome.knowledge_created),
-            json.dumps(outcome.artifacts_produced),
-            json.dumps(outcome.what_worked),
-            json.dumps(outcome.what_didnt),
+            _dumps(outcome.knowledge_created),
+            _dumps(outcome.artifacts_produced),
+            _dumps(outcome.what_worked),
+            _dumps(outcome.what_didnt),
             outcome.lessons_learned,
-            json.dumps(outcome.participant_ratings),
+            _dumps(outcome.participant_ratings),
             outcome.created_at.isoformat()
         ))
 
-        self.conn.commit()
-
         # Record learning signal
         self._record_learning_signal(outcome)
 
@@ -379,9 +851,9 @@ class SubstrateDatabase:
             return
 
         # Load the match to get features
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT * FROM matches WHERE match_id = ?", (outcome.match_id,))
-        match_row = cursor.fetchone()
+        match_row = self.conn.execute(
+            _SQL_SELECT_MATCH_FEATURES, (outcome.match_id,)
+        ).fetchone()
 
         if not match_row:
             return
@@ -397,96 +869,83 @@ class SubstrateDatabase:
         # Signal value: 1.0 for success, 0.0 for failure
         signal_value = 1.0 if outcome.success else 0.0
 
-        cursor.execute("""
-            INSERT INTO learning_signals
-            (match_id, signal_type, signal_value, features, created_at)
-            VALUES (?, ?, ?, ?, ?)
-        """, (
+        self.conn.execute(_SQL_INSERT_LEARNING_SIGNAL, (
             outcome.match_id,
             'outcome',
             signal_value,
-            json.dumps(features),
+            _dumps(features),
             datetime.now().isoformat()
         ))
 
-        self.conn.commit()
+    def get_match_history(self, limit: int = 100) -> Iterator[sqlite3.Row]:
+        """
+        Get recent match history
 
-    def get_match_history(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get recent match history"""
+        Rows are streamed from the cursor; sqlite3.Row supports access by
+        column name, so no per-row dict is built.
+        """
 
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT * FROM matches
-            ORDER BY created_at DESC
-            LIMIT ?
-        """, (limit,))
+        yield from self.conn.execute(_SQL_MATCH_HISTORY, (limit,))
 
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+    def get_match_history_dicts(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Get recent match history as a list of dicts (provenance decoded)"""
 
-    def get_learning_signals(self, signal_type: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get learning signals for model improvement"""
+        history = []
+        for row in self.get_match_history(limit):
+            match = dict(row)
+            match['provenance'] = _unpack_provenance(match['provenance'])
+            history.append(match)
+        return history
 
-        cursor = self.conn.cursor()
+    def get_learning_signals(self, signal_type: Optional[str] = None) -> Iterator[sqlite3.Row]:
+        """Get learning signals for model improvement (streamed rows)"""
 
         if signal_type:
-            cursor.execute("""
-                SELECT * FROM learning_signals
-                WHERE signal_type = ?
-                ORDER BY created_at DESC
-            """, (signal_type,))
+            yield from self.conn.execute(_SQL_LEARNING_SIGNALS_BY_TYPE, (signal_type,))
         else:
-            cursor.execute("""
-                SELECT * FROM learning_signals
-                ORDER BY created_at DESC
-            """)
+            yield from self.conn.execute(_SQL_LEARNING_SIGNALS)
 
-        rows = cursor.fetchall()
-        return [dict(row) for row in rows]
+    def get_learning_signals_dicts(self, signal_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get learning signals as a list of dicts"""
+        return list(map(dict, self.get_learning_signals(signal_type)))
 
-    def get_success_rate_by_features(self) -> Dict[str, float]:
+    def get_success_rate_by_features(self) -> Dict[str, Any]:
         """Analyze which match features correlate with success"""
 
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT features, signal_value
-            FROM learning_signals
-            WHERE signal_type = 'outcome'
-        """)
-
-        rows = cursor.fetchall()
+        # Aggregate in SQLite rather than pulling every signal into Python
+        analytics = self._analytics()
+        totals = analytics.execute(_SQL_OUTCOME_SUCCESS_TOTALS).fetchone()
+        total = totals['total']
 
-        if not rows:
+        if not total:
             return {}
 
-        # Simple analysis: average success rate
-        total = len(rows)
-        successes = sum(1 for row in rows if row['signal_value'] > 0.5)
+        successes = totals['successes']
+
+        # Success rate per match-score decile (key is the bucket's lower bound)
+        by_score = {
+            f"{row['bucket'] / 10:.1f}": row['successes'] / row['total']
+            for row in analytics.execute(_SQL_OUTCOME_SUCCESS_BY_SCORE)
+            if row['bucket'] is not None
+        }
 
         return {
-            'overall_success_rate': successes / total if total > 0 else 0.0,
+            'overall_success_rate': successes / total,
             'total_outcomes': total,
-            'total_successes': successes
+            'total_successes': successes,
+            'success_rate_by_match_score': by_score
         }
 
     def get_user_stats(self, user_id: str) -> Dict[str, Any]:
         """Get statistics for a user"""
 
-        cursor = self.conn.cursor()
+        analytics = self._analytics()
 
         # Matches as need requester
-        cursor.execute("""
-            SELECT COUNT(*) as count, AVG(match_score) as avg_score
-            FROM matches WHERE need_user_id = ?
-        """, (user_id,))
-        need_stats = dict(cursor.fetchone())
+        need_stats = dict(analytics.execute(_SQL_REQUESTER_STATS, (user_id,)).fetchone())
 
         # Matches as capability provider
-        cursor.execute("""
-            SELECT COUNT(*) as count, AVG(match_score) as avg_score
-            FROM matches WHERE capability_user_id = ?
-        """, (user_id,))
-        cap_stats = dict(cursor.fetchone())
+        cap_stats = dict(analytics.execute(_SQL_PROVIDER_STATS, (user_id,)).fetchone())
 
         return {
             'as_requester': need_stats,
@@ -494,5 +953,13 @@ class SubstrateDatabase:
         }
 
     def close(self):
-        """Close database connection"""
+        """Flush pending writes and close database connections"""
+        with self._write_lock:
+            self._writer_stopped = True
+        if self._writer is not None:
+            self._stop_writer()  # Queues the stop sentinel (once)
+            self._writer.join()
+        if self._analytics_conn is not None:
+            self._analytics_conn.close()
+            self._analytics_conn = None
         self.conn.close()
@@ -12,14 +12,21 @@ Endpoints:
 - POST /match/{match_id}/reject - Reject a match
 - POST /outcomes - Report collaboration outcome
 - GET /stats - Get system statistics
+- POST /warmup - Load the embedding model ahead of the first real request
 
 All responses include transparency/provenance data.
 """
 
 from typing import List, Dict, Any, Optional
+from collections import OrderedDict
 from datetime import datetime
+import json
+import threading
+import time
 from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 import uvicorn
 
@@ -38,10 +45,21 @@ from substrate.shared.models.core import (
     ProblemDomain,
     PrivacyLevel
 )
-from substrate.cloud.matching.semantic_engine import SemanticMatcher, SemanticMatchingConfig
 from substrate.cloud.transparency.engine import TransparencyEngine
 from substrate.shared.persistence.database import SubstrateDatabase
 
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+
+    _json_bytes = orjson.dumps
+except ImportError:
+    DefaultResponse = JSONResponse
+
+    def _json_bytes(obj: Any) -> bytes:
+        # Same encoding JSONResponse uses
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
 # Pydantic models for API
 class CapabilityCreate(BaseModel):
@@ -90,11 +108,49 @@ class OutcomeCreate(BaseModel):
     lessons_learned: str = ""
 
 
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire `ttl` seconds after being set
+
+    Handlers run on the event loop thread and never await between a lookup
+    and the following store, so no lock is needed.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (expires, value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return default
+        if item[0] < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return item[1]
+
+    def __setitem__(self, key: str, value: Any):
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        item = self._data.pop(key, None)
+        return default if item is None else item[1]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Substrate API",
     description="Transparent AI Coordination Platform",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=DefaultResponse
 )
 
 # Enable CORS for web interface
@@ -106,15 +162,51 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize Substrate components
-db = SubstrateDatabase()
-matcher = SemanticMatcher(SemanticMatchingConfig(
-    chromadb_path="./substrate_data/chroma"
-))
-transparency = TransparencyEngine()
-
-# In-memory cache of profiles (in production: use Redis)
-profile_cache: Dict[str, UserProfile] = {}
+# Substrate components. Created on startup rather than at import; the matcher
+# (sentence-transformers/ChromaDB) is only loaded when first needed.
+db: Optional[SubstrateDatabase] = None
+transparency: Optional[TransparencyEngine] = None
+_matcher = None
+_matcher_lock = threading.Lock()
+
+
+def get_matcher():
+    """
+    Semantic matcher, imported and initialized on first use
+
+    Building it loads the embedding model and ChromaDB, so async endpoints
+    must call this through run_in_threadpool rather than on the event loop.
+    """
+    global _matcher
+    if _matcher is None:
+        # Warmup and a first profile request can get here together from the
+        # threadpool; only one of them builds the matcher
+        with _matcher_lock:
+            if _matcher is None:
+                from substrate.cloud.matching.semantic_engine import SemanticMatcher, SemanticMatchingConfig
+                _matcher = SemanticMatcher(SemanticMatchingConfig(
+                    chromadb_path="./substrate_data/chroma"
+                ))
+    return _matcher
+
+
+# In-memory cache of profiles (in production: use Redis). Bounded, and entries
+# expire so changes written by other processes are picked up.
+profile_cache = TTLCache(maxsize=10_000, ttl=300)
+
+# Serialized GET /profiles/{user_id} bodies, refreshed whenever the profile is written
+profile_response_cache = TTLCache(maxsize=10_000, ttl=300)
+
+
+def _profile_response_body(profile: UserProfile) -> bytes:
+    """Serialize the shareable view returned by GET /profiles/{user_id}"""
+    return _json_bytes({
+        "user_id": profile.user_id,
+        "capabilities": [cap.to_shareable_dict() for cap in profile.capabilities],
+        "domains": [d.value for d in profile.domains],
+        "location_region": profile.location_region,
+        "timezone": profile.timezone
+    })
 
 
 @app.get("/")
@@ -128,6 +220,29 @@ async def root():
     }
 
 
+@app.post("/warmup")
+def warmup():
+    """
+    Load the semantic matcher and run one throwaway embedding
+
+    Clients (or a deploy readiness probe) can call this so the model load
+    and first-encode warmup don't land on the first real profile request.
+    A plain def so FastAPI runs the blocking load in its threadpool instead
+    of stalling the event loop.
+    """
+    matcher = get_matcher()
+    embeddings = matcher.embedding_model is not None
+    if embeddings:
+        matcher.embedding_model.encode("warmup", convert_to_numpy=True)
+
+    return {
+        "status": "success",
+        "embeddings_ready": embeddings,
+        "message": ("Matcher loaded and warmed up" if embeddings
+                    else "Matcher loaded without embeddings (keyword fallback)")
+    }
+
+
 @app.post("/profiles")
 async def create_profile(profile_data: ProfileCreate):
     """Create or update a user profile"""
@@ -157,11 +272,13 @@ async def create_profile(profile_data: ProfileCreate):
     # Save to database
     db.save_user_profile(profile)
 
-    # Index for matching
+    # Index for matching (the first call loads the matcher, off the event loop)
+    matcher = await run_in_threadpool(get_matcher)
     matcher.index_user_profile(profile)
 
     # Cache
     profile_cache[profile.user_id] = profile
+    profile_response_cache[profile.user_id] = _profile_response_body(profile)
 
     return {
         "status": "success",
@@ -175,24 +292,21 @@ async def create_profile(profile_data: ProfileCreate):
 async def get_profile(user_id: str):
     """Get a user profile"""
 
-    # Check cache first
-    if user_id in profile_cache:
-        profile = profile_cache[user_id]
-    else:
-        # Load from database
-        profile = db.load_user_profile(user_id)
-        if not profile:
-            raise HTTPException(status_code=404, detail="Profile not found")
-        profile_cache[user_id] = profile
+    # Serve the already-encoded shareable version if we have it
+    body = profile_response_cache.get(user_id)
+    if body is None:
+        profile = profile_cache.get(user_id)
+        if profile is None:
+            # Load from database
+            profile = db.load_user_profile(user_id)
+            if not profile:
+                raise HTTPException(status_code=404, detail="Profile not found")
+            profile_cache[user_id] = profile
 
-    # Return shareable version
-    return {
-        "user_id": profile.user_id,
-        "capabilities": [cap.to_shareable_dict() for cap in profile.capabilities],
-        "domains": [d.value for d in profile.domains],
-        "location_region": profile.location_region,
-        "timezone": profile.timezone
-    }
+        body = _profile_response_body(profile)
+        profile_response_cache[user_id] = body
+
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/needs")
@@ -225,13 +339,12 @@ async def find_matches(match_request: MatchRequest):
     """Find matches for a need"""
 
     # Load user profile
-    if match_request.user_id not in profile_cache:
+    profile = profile_cache.get(match_request.user_id)
+    if profile is None:
         profile = db.load_user_profile(match_request.user_id)
         if not profile:
             raise HTTPException(status_code=404, detail="User profile not found")
         profile_cache[match_request.user_id] = profile
-    else:
-        profile = profile_cache[match_request.user_id]
 
     # Load need (simplified - in production would query from DB)
     # For now, assume need is passed or created
@@ -309,14 +422,12 @@ async def get_stats():
     # Get success rates
     success_stats = db.get_success_rate_by_features()
 
-    # Get match history count
-    history = db.get_match_history(limit=1000)
-
-    # Calculate stats
-    total_matches = len(history)
+    # Calculate stats over recent match history (rows are streamed)
+    total_matches = 0
     statuses = {}
-    for match in history:
-        status = match.get('status', 'unknown')
+    for match in db.get_match_history(limit=1000):
+        total_matches += 1
+        status = match['status'] or 'unknown'
         statuses[status] = statuses.get(status, 0) + 1
 
     return {
@@ -341,10 +452,19 @@ async def get_user_stats(user_id: str):
     }
 
 
+@app.on_event("startup")
+async def startup_event():
+    """Open the database and create the lightweight engines"""
+    global db, transparency
+    db = SubstrateDatabase()
+    transparency = TransparencyEngine()
+
+
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown"""
-    db.close()
+    if db is not None:
+        db.close()
 
 
 # For running directly